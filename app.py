@@ -1,13 +1,32 @@
 import os
+from contextlib import asynccontextmanager
 import gradio as gr
 from fastapi import FastAPI, HTTPException, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from typing import List, Dict, Optional
-from chatopt import ChatOPT
+from typing import Optional
+from chatopt import ChatOPT, MasterplanResponse
+from gradio_app import build_demo
+from settings import UVICORN_HTTP, UVICORN_LOOP, WORKERS
 
 
-app = FastAPI(title="ChatOPT", description="API for generating API specifications and OPT masterplan")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    On shutdown, persist the semantic masterplan cache so the next start is warm,
+    then close the pooled HTTP client used for OpenAI calls.
+    """
+    yield
+    chat_opt.save_cache()
+    await chat_opt.aclose()
+
+app = FastAPI(
+    title="ChatOPT",
+    description="API for generating API specifications and OPT masterplan",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
+)
 
 # Add CORS middleware
 app.add_middleware(
@@ -32,26 +51,6 @@ class OperatingModelRequest(BaseModel):
     industry: Optional[str] = None
     business_size: Optional[str] = None
 
-class APISpec(BaseModel):
-    """
-    Model for API specifications.
-    Contains the name, description, endpoints, and whether to build in-house.
-    """
-    name: str
-    description: str
-    endpoints: List[Dict]
-    build_in_house: bool
-    reason: str
-
-class MasterplanResponse(BaseModel):
-    """
-    Response model for the masterplan generation.
-    Contains the generated markdown content and API specifications.
-    """
-    markdown_content: str
-    api_specs: List[APISpec]
-    questions: Optional[List[str]] = None
-
 @app.get("/")
 async def root():
     """
@@ -60,7 +59,9 @@ async def root():
     """
     return {"message": "Welcome to ChatOPT API. Use /docs for the API documentation."}
 
-@app.post("/generate_masterplan", response_model=MasterplanResponse)
+# response_model=None skips FastAPI re-validating the already validated MasterplanResponse;
+# responses keeps the schema in the API docs
+@app.post("/generate_masterplan", response_model=None, responses={200: {"model": MasterplanResponse}})
 async def generate_masterplan(request: OperatingModelRequest):
     """ 
     Generate the masterplan and API specifications based on the provided mission statement and company details.
@@ -69,16 +70,32 @@ async def generate_masterplan(request: OperatingModelRequest):
     """
     try:
         # Generate the masterplan using ChatOPT
-        result = chat_opt.generate_masterplan(
+        result = await chat_opt.generate_masterplan(
             mission_statement=request.mission_statement,
             company_name=request.company_name,
             industry=request.industry,
             business_size=request.business_size
         )
-        return result
+        return ORJSONResponse(content=result.model_dump())
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/generate_masterplan/stream")
+async def stream_masterplan(request: OperatingModelRequest):
+    """
+    Stream the masterplan as it is generated, so clients can render it before the full response is ready.
+    The streamed text is the markdown content followed by the JSON array of API specifications.
+    """
+    return StreamingResponse(
+        chat_opt.stream_masterplan(
+            mission_statement=request.mission_statement,
+            company_name=request.company_name,
+            industry=request.industry,
+            business_size=request.business_size
+        ),
+        media_type="text/plain; charset=utf-8"
+    )
+
 @app.post("/ask_questions")
 async def ask_questions(request: OperatingModelRequest):
     """
@@ -89,7 +106,7 @@ async def ask_questions(request: OperatingModelRequest):
     """
     try:
         # Generate questions to gather more information
-        questions = chat_opt.generate_questions(
+        questions = await chat_opt.generate_questions(
             mission_statement=request.mission_statement,
             company_name=request.company_name,
             industry=request.industry,
@@ -99,7 +116,18 @@ async def ask_questions(request: OperatingModelRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-# Launch the Gradio interface when run directly
+# Serve the Gradio UI from the same process so it calls chat_opt directly instead of over HTTP
+app = gr.mount_gradio_app(app, build_demo(chat_opt), path="/ui")
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("app:app", host="0.0.0.0", port=8000, reload=True) 
\ No newline at end of file
+    # Auto-reload is for local development only (DEV=1); it forces a single worker
+    uvicorn.run(
+        "app:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=os.getenv("DEV") == "1",
+        workers=WORKERS,
+        loop=UVICORN_LOOP,
+        http=UVICORN_HTTP
+    ) 
\ No newline at end of file
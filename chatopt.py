@@ -1,15 +1,92 @@
 import os
+import re
 import json
-from typing import List, Dict, Optional
+import asyncio
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Dict, Optional, Tuple
+import faiss
+import httpx
+import numpy as np
+import orjson
 from pydantic import BaseModel
 from dotenv import load_dotenv
 from langchain.prompts import PromptTemplate
-from langchain.chains import LLMChain
-from langchain_openai import ChatOpenAI
+from langchain_community.cache import RedisCache, SQLiteCache
+from langchain_core.outputs import Generation
+from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
 
 load_dotenv()
 
+# Connection pool shared by all OpenAI chat and embedding calls
+HTTP_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+HTTP_TIMEOUT = 60
+
+# Maximum number of distinct business contexts kept in the exact-match LLM caches
+LLM_CACHE_SIZE = 512
+
+# Embedding model and settings used by the semantic masterplan cache
+EMBEDDING_MODEL = "text-embedding-3-small"
+EMBEDDING_DIMENSION = 1536
+HNSW_M = 32
+EMBEDDING_CACHE_SIZE = 4096
+SEMANTIC_CACHE_THRESHOLD = 0.92
+# Nearest neighbours checked per lookup for one in the requested partition
+SEMANTIC_CACHE_SEARCH_K = 8
+SEMANTIC_CACHE_SIZE = 10000
+# Fraction the cache may grow past its size before the oldest entries are evicted in bulk
+SEMANTIC_CACHE_EVICT_SLACK = 0.1
+SEMANTIC_CACHE_PATH = os.getenv("SEMANTIC_CACHE_PATH", ".semantic_cache")
+
+# Persistent exact-match LangChain LLM cache. Set REDIS_URL to share it between processes
+# and hosts, otherwise a local SQLite database is used. This is deliberately not a semantic
+# cache: the prompts share a long static prefix, so whole-prompt embeddings of unrelated
+# businesses would match each other. It is not installed as the global LangChain cache:
+# ChatOPT only stores replies that parsed successfully, so a bad reply never outlives a restart
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".llm_cache.db")
+REDIS_URL = os.getenv("REDIS_URL")
+
+if REDIS_URL:
+    from redis import Redis
+    LLM_CACHE = RedisCache(redis_=Redis.from_url(REDIS_URL))
+else:
+    LLM_CACHE = SQLiteCache(database_path=LLM_CACHE_PATH)
+
+# Start of the API specifications JSON array in a masterplan response
+API_SPECS_RE = re.compile(r'\[\s*\{\s*"name":')
+JSON_DECODER = json.JSONDecoder()
+
+def async_lru_cache(maxsize: int):
+    """
+    LRU cache decorator for coroutine functions.
+    functools.lru_cache would cache the coroutine object, which can only be awaited once,
+    so this caches the awaited result instead. Exceptions are not cached, and
+    cache_evict(*args) drops a result the caller found to be unusable.
+    """
+    def decorator(fn: Callable[..., Awaitable[Any]]) -> Callable[..., Awaitable[Any]]:
+        cache: "OrderedDict[tuple, Any]" = OrderedDict()
+
+        @wraps(fn)
+        async def wrapper(*args):
+            if args in cache:
+                cache.move_to_end(args)
+                return cache[args]
+            result = await fn(*args)
+            cache[args] = result
+            if len(cache) > maxsize:
+                cache.popitem(last=False)
+            return result
+
+        def cache_evict(*args) -> None:
+            cache.pop(args, None)
+
+        wrapper.cache_clear = cache.clear
+        wrapper.cache_evict = cache_evict
+        return wrapper
+    return decorator
+
 class APISpec(BaseModel):
     """ 
     Model representing an API specification.
@@ -36,31 +113,149 @@ class MasterplanResponse(BaseModel):
     api_specs: List[APISpec]
     questions: Optional[List[str]] = None
 
+class SemanticCache:
+    """
+    Cache that matches queries by cosine similarity of their embeddings.
+    Each entry also has a partition key that must match exactly, so only entries
+    in the same partition are candidates for a semantic match.
+    Vectors are L2-normalized and stored in a FAISS HNSW index using inner product,
+    so lookups stay sub-linear as the cache grows. HNSW cannot remove vectors, so the
+    cache may grow past max_size by SEMANTIC_CACHE_EVICT_SLACK before the oldest entries
+    are evicted in bulk and the index is rebuilt from the newest max_size vectors.
+    """
+    def __init__(self, dimension: int = EMBEDDING_DIMENSION, threshold: float = SEMANTIC_CACHE_THRESHOLD,
+                 max_size: int = SEMANTIC_CACHE_SIZE):
+        self.dimension = dimension
+        self.threshold = threshold
+        self.max_size = max_size
+        self.index = self._new_index()
+        self.entries: List[MasterplanResponse] = []
+        self.partitions: List[tuple] = []
+        # FAISS indexes are not safe for concurrent add and search
+        self._lock = threading.Lock()
+        self._rebuilding = False
+
+    def _new_index(self) -> "faiss.Index":
+        """Create an empty HNSW index over inner-product similarity"""
+        return faiss.IndexHNSWFlat(self.dimension, HNSW_M, faiss.METRIC_INNER_PRODUCT)
+
+    def _normalize(self, vector) -> np.ndarray:
+        """Return the vector as a (1, d) float32 array with unit L2 norm"""
+        vector = np.asarray(vector, dtype=np.float32).reshape(1, -1)
+        faiss.normalize_L2(vector)
+        return vector
+
+    def lookup(self, vector, partition: tuple) -> Optional[MasterplanResponse]:
+        """
+        Return the entry in the partition most similar to the vector,
+        or None if nothing there is close enough
+        """
+        query = self._normalize(vector)
+        with self._lock:
+            if not self.entries:
+                return None
+            D, I = self.index.search(query, SEMANTIC_CACHE_SEARCH_K)
+            # Results are sorted by similarity, so the first match in the partition is the best one
+            for score, idx in zip(D[0], I[0]):
+                if idx < 0 or score < self.threshold:
+                    break
+                if self.partitions[idx] == partition:
+                    return self.entries[idx]
+            return None
+
+    def add(self, vector, partition: tuple, entry: MasterplanResponse) -> None:
+        """Store an entry under the given embedding and partition, evicting the oldest entries if full"""
+        row = self._normalize(vector)
+        with self._lock:
+            self.index.add(row)
+            self.entries.append(entry)
+            self.partitions.append(partition)
+            if self._rebuilding or len(self.entries) <= self.max_size * (1 + SEMANTIC_CACHE_EVICT_SLACK):
+                return
+            self._rebuilding = True
+            overflow = len(self.entries) - self.max_size
+            total = self.index.ntotal
+            vectors = self.index.reconstruct_n(overflow, total - overflow)
+
+        try:
+            # Build the replacement index without holding the lock, so lookups are not blocked
+            index = self._new_index()
+            index.add(vectors)
+            with self._lock:
+                # Carry over anything inserted while the new index was being built
+                if self.index.ntotal > total:
+                    index.add(self.index.reconstruct_n(total, self.index.ntotal - total))
+                self.index = index
+                del self.entries[:overflow]
+                del self.partitions[:overflow]
+        finally:
+            self._rebuilding = False
+
+    def save(self, path: str) -> None:
+        """
+        Persist the index and its entries so a restarted process starts warm.
+        Both are written to a single file that is atomically replaced, so processes saving
+        concurrently never leave an index paired with another process's entries.
+        """
+        with self._lock:
+            index = faiss.serialize_index(self.index)
+            entries = orjson.dumps([entry.model_dump() for entry in self.entries])
+            partitions = orjson.dumps(self.partitions)
+        tmp_path = f"{path}.npz.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                index=index,
+                entries=np.frombuffer(entries, dtype=np.uint8),
+                partitions=np.frombuffer(partitions, dtype=np.uint8)
+            )
+        os.replace(tmp_path, f"{path}.npz")
+
+    def load(self, path: str) -> bool:
+        """Load a previously saved index and entries. Returns False if nothing usable was found"""
+        if not os.path.exists(f"{path}.npz"):
+            return False
+        with np.load(f"{path}.npz") as data:
+            if "partitions" not in data:
+                return False
+            index = faiss.deserialize_index(data["index"])
+            entries = [MasterplanResponse(**entry) for entry in orjson.loads(data["entries"].tobytes())]
+            partitions = [tuple(partition) for partition in orjson.loads(data["partitions"].tobytes())]
+        if index.d != self.dimension or not index.ntotal == len(entries) == len(partitions):
+            return False
+        with self._lock:
+            self.index = index
+            self.entries = entries
+            self.partitions = partitions
+        return True
+
 class ChatOPT:
     def __init__(self):
         """
         Initialize the ChatOPT instance with the OpenAI model and define the prompts.
         The prompts are used to generate follow-up questions and the API masterplan.
         """
+        # Pooled keep-alive HTTP/2 client reused across requests to skip per-call connection setup
+        self._http = httpx.AsyncClient(http2=True, limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT)
+
         self.llm = ChatOpenAI(
             model_name="gpt-4",
             temperature=0.7,
+            http_async_client=self._http,
             model_kwargs={"top_p": 0.9}
         )
         
         
+        # Static instructions come first and the business context last, so every request shares
+        # the same prompt prefix. The prefixes are currently below OpenAI's 1024-token minimum for
+        # prompt caching and gpt-4 does not support it, so this only pays off with a newer model
+        # and longer instructions
         self.questions_prompt = PromptTemplate(
             input_variables=["mission_statement", "company_name", "industry", "business_size"],
             template="""
             You are ChatOPT, an expert in API design and software architecture. Your task is to ask follow-up questions to gather more information about the business before generating an API masterplan.
             
-            Business Context:
-            - Mission Statement/Operating Model: {mission_statement}
-            - Company Name: {company_name}
-            - Industry: {industry}
-            - Business Size: {business_size}
-            
-            Based on this information, generate 5-7 specific questions that will help you better understand:
+            Based on the business context provided at the end, generate 5-7 specific questions that will help you better understand:
             1. The core business processes
             2. The users/customers and their needs
             3. Existing systems and integrations
@@ -69,19 +264,21 @@ class ChatOPT:
             6. Security and compliance requirements
             
             Format your output as a JSON list of strings containing only the questions, without any introductory text.
-            """
-        )
-        
-        self.masterplan_prompt = PromptTemplate(
-            input_variables=["mission_statement", "company_name", "industry", "business_size"],
-            template="""
-            You are ChatOPT, an expert in API design and software architecture. Based on the business context below, create a comprehensive API masterplan.
+            
+            ---
             
             Business Context:
             - Mission Statement/Operating Model: {mission_statement}
             - Company Name: {company_name}
             - Industry: {industry}
             - Business Size: {business_size}
+            """
+        )
+        
+        self.masterplan_prompt = PromptTemplate(
+            input_variables=["mission_statement", "company_name", "industry", "business_size"],
+            template="""
+            You are ChatOPT, an expert in API design and software architecture. Based on the business context provided at the end, create a comprehensive API masterplan.
             
             Generate a markdown OPT (Operating Process Technology) masterplan that includes:
             
@@ -129,104 +326,287 @@ class ChatOPT:
                ```
             
             IMPORTANT: Make sure your JSON is valid and properly formatted.
+            
+            ---
+            
+            Business Context:
+            - Mission Statement/Operating Model: {mission_statement}
+            - Company Name: {company_name}
+            - Industry: {industry}
+            - Business Size: {business_size}
             """
         )
-        
-        # Create the chains
-        self.questions_chain = LLMChain(llm=self.llm, prompt=self.questions_prompt)
-        self.masterplan_chain = LLMChain(llm=self.llm, prompt=self.masterplan_prompt)
+
+        # Identifies the model settings in the persistent LLM cache
+        self._llm_string = f"{self.llm.model_name}|{self.llm.temperature}|{self.llm.model_kwargs}"
+        # Prompts whose fresh LLM reply has not been validated and persisted yet
+        self._unpersisted: set = set()
+
+        # Exact-match caches of the raw LLM responses, keyed on the business context tuple.
+        # Only the raw string is cached; parsing into models happens on every call, and
+        # responses that fail to parse are evicted so the next request asks the LLM again.
+        self._run_questions_cached = async_lru_cache(LLM_CACHE_SIZE)(self._run_questions)
+        self._run_masterplan_cached = async_lru_cache(LLM_CACHE_SIZE)(self._run_masterplan)
+
+        # Semantic cache of parsed masterplans for near-duplicate mission statements,
+        # partitioned exactly by company name, industry and business size
+        self.embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL, http_async_client=self._http)
+        # Exact-match cache of embeddings so repeated contexts skip the embeddings API call.
+        # Stored as tuples so callers cannot mutate the cached vectors.
+        self._embed_cached = async_lru_cache(EMBEDDING_CACHE_SIZE)(self._embed_text)
+        self.masterplan_cache = SemanticCache()
+        try:
+            self.masterplan_cache.load(SEMANTIC_CACHE_PATH)
+        except Exception as e:
+            print(f"Error loading semantic cache: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client"""
+        await self._http.aclose()
+
+    def save_cache(self) -> None:
+        """Persist the semantic masterplan cache to disk"""
+        try:
+            self.masterplan_cache.save(SEMANTIC_CACHE_PATH)
+        except Exception as e:
+            print(f"Error saving semantic cache: {str(e)}")
+
+    @staticmethod
+    def _context_key(mission_statement: str, company_name: str = None,
+                     industry: str = None, business_size: str = None) -> tuple:
+        """Build the hashable business context tuple used as the LLM cache key"""
+        return (
+            mission_statement,
+            company_name or "Not specified",
+            industry or "Not specified",
+            business_size or "Not specified"
+        )
+
+    @staticmethod
+    def _context_inputs(key: tuple) -> Dict[str, str]:
+        """Turn a business context tuple back into the prompt input variables"""
+        mission_statement, company_name, industry, business_size = key
+        return {
+            "mission_statement": mission_statement,
+            "company_name": company_name,
+            "industry": industry,
+            "business_size": business_size
+        }
+
+    @staticmethod
+    def _context_partition(key: tuple) -> tuple:
+        """
+        Return the part of a business context that must match exactly for a semantic cache hit.
+        These are a few tokens each, so embedding them alongside the mission statement would
+        barely move the similarity score and let one company's plan be served to another
+        """
+        return key[1:]
+
+    async def _complete(self, prompt: str) -> str:
+        """Return the LLM reply to a prompt, from the persistent cache if a validated reply is stored"""
+        try:
+            cached = await LLM_CACHE.alookup(prompt, self._llm_string)
+            if cached:
+                return cached[0].text
+        except Exception as e:
+            print(f"Error reading LLM cache: {str(e)}")
+        message = await self.llm.ainvoke(prompt)
+        self._unpersisted.add(prompt)
+        return message.content
+
+    async def _settle_reply(self, prompt: str, response: str, parsed: bool) -> None:
+        """Persist a fresh reply that parsed successfully; forget one that did not"""
+        if prompt not in self._unpersisted:
+            return
+        self._unpersisted.discard(prompt)
+        if not parsed:
+            return
+        try:
+            await LLM_CACHE.aupdate(prompt, self._llm_string, [Generation(text=response)])
+        except Exception as e:
+            print(f"Error writing LLM cache: {str(e)}")
+
+    def _questions_text(self, key: tuple) -> str:
+        """Format the questions prompt for a business context"""
+        return self.questions_prompt.format(**self._context_inputs(key))
+
+    def _masterplan_text(self, key: tuple) -> str:
+        """Format the masterplan prompt for a business context"""
+        return self.masterplan_prompt.format(**self._context_inputs(key))
+
+    async def _embed_text(self, text: str) -> tuple:
+        """Embed a piece of text with the OpenAI embeddings model"""
+        return tuple(await self.embeddings.aembed_query(text))
+
+    async def _embed_mission(self, key: tuple) -> Optional[np.ndarray]:
+        """Embed the mission statement of a business context, returning None if the embeddings call fails"""
+        try:
+            return np.asarray(await self._embed_cached(key[0]), dtype=np.float32)
+        except Exception as e:
+            print(f"Error embedding mission statement: {str(e)}")
+            return None
+
+    async def _run_questions(self, key: tuple) -> str:
+        """Run the questions prompt and return the raw LLM response"""
+        return await self._complete(self._questions_text(key))
+
+    async def _run_masterplan(self, key: tuple) -> str:
+        """Run the masterplan prompt and return the raw LLM response"""
+        return await self._complete(self._masterplan_text(key))
     
-    def generate_questions(self, mission_statement: str, company_name: str = None, 
+    async def generate_questions(self, mission_statement: str, company_name: str = None, 
                           industry: str = None, business_size: str = None) -> List[str]:
         """Generate follow-up questions based on the initial business information
            Returns a list of questions to gather more information
         """
         try:
-            response = self.questions_chain.run({
-                "mission_statement": mission_statement,
-                "company_name": company_name or "Not specified",
-                "industry": industry or "Not specified",
-                "business_size": business_size or "Not specified"
-            })
+            key = self._context_key(mission_statement, company_name, industry, business_size)
+            response = await self._run_questions_cached(key)
             
             # Parse the JSON response
+            questions = None
             try:
-                questions = json.loads(response)
-                if isinstance(questions, list):
-                    return questions
-                return ["Could not generate questions. Please try again."]
-            except json.JSONDecodeError:
+                parsed = orjson.loads(response)
+                if isinstance(parsed, list):
+                    questions = parsed
+            except orjson.JSONDecodeError:
                 # If not valid JSON, try to extract questions from the text
                 lines = [line.strip() for line in response.strip().split('\n') 
                          if line.strip() and not line.strip().startswith('[') and not line.strip().endswith(']')]
                 if lines:
-                    return lines
-                return ["Could not generate questions. Please try again."]
+                    questions = lines
+
+            await self._settle_reply(self._questions_text(key), response, questions is not None)
+            if questions is not None:
+                return questions
+
+            # Don't keep serving a reply we could not use
+            self._run_questions_cached.cache_evict(key)
+            return ["Could not generate questions. Please try again."]
                 
         except Exception as e:
             print(f"Error generating questions: {str(e)}")
             return ["An error occurred while generating questions. Please try again."]
     
-    def generate_masterplan(self, mission_statement: str, company_name: str = None,
+    def _parse_masterplan(self, response: str) -> Tuple[MasterplanResponse, bool]:
+        """
+        Split a raw masterplan LLM response into the markdown content and API specs
+        Returns the parsed masterplan and whether valid API specs JSON was found.
+        Without it the masterplan holds just the markdown and should not be cached
+        """
+        # Extract the markdown content and API specs JSON
+        markdown_content = response
+        api_specs = []
+        
+        # Try to find and parse the JSON part
+        try:
+            # Look for JSON array pattern
+            json_match = API_SPECS_RE.search(response)
+            if json_match:
+                json_start = json_match.start()
+                # Parse the array and ignore whatever text follows it
+                api_specs_raw, _ = JSON_DECODER.raw_decode(response, json_start)
+                api_specs = [APISpec(**spec) for spec in api_specs_raw]
+                
+                # Remove the JSON part from the markdown content
+                markdown_content = response[:json_start].strip()
+            
+            # If no JSON found in expected format, return just the markdown
+            return MasterplanResponse(
+                markdown_content=markdown_content,
+                api_specs=api_specs
+            ), json_match is not None
+            
+        except (json.JSONDecodeError, ValueError, TypeError) as e:
+            # If JSON parsing fails, return just the markdown
+            print(f"Error parsing API specs JSON: {str(e)}")
+            return MasterplanResponse(
+                markdown_content=markdown_content,
+                api_specs=[]
+            ), False
+
+    async def generate_masterplan(self, mission_statement: str, company_name: str = None,
                            industry: str = None, business_size: str = None) -> MasterplanResponse:
         """
         Generate the API masterplan based on the business information
         Returns a MasterplanResponse object containing the markdown content and API specs
         """
         try:
-            response = self.masterplan_chain.run({
-                "mission_statement": mission_statement,
-                "company_name": company_name or "Not specified",
-                "industry": industry or "Not specified",
-                "business_size": business_size or "Not specified"
-            })
-            
-            # Extract the markdown content and API specs JSON
-            markdown_content = response
-            api_specs = []
-            
-            # Try to find and parse the JSON part
-            try:
-                # Look for JSON array pattern
-                import re
-                json_match = re.search(r'\[\s*{\s*"name":', response)
-                if json_match:
-                    json_start = json_match.start()
-                    json_content = response[json_start:]
-                    # Find the closing bracket for the array
-                    bracket_count = 0
-                    for i, char in enumerate(json_content):
-                        if char == '[':
-                            bracket_count += 1
-                        elif char == ']':
-                            bracket_count -= 1
-                            if bracket_count == 0:
-                                json_content = json_content[:i+1]
-                                break
-                    
-                    api_specs_raw = json.loads(json_content)
-                    api_specs = [APISpec(**spec) for spec in api_specs_raw]
-                    
-                    # Remove the JSON part from the markdown content
-                    markdown_content = response[:json_start].strip()
-                
-                # If no JSON found in expected format, return just the markdown
-                return MasterplanResponse(
-                    markdown_content=markdown_content,
-                    api_specs=api_specs
+            key = self._context_key(mission_statement, company_name, industry, business_size)
+
+            # Reuse a cached masterplan for a semantically equivalent mission statement of the same business
+            vector = await self._embed_mission(key)
+            if vector is not None:
+                cached = await asyncio.to_thread(
+                    self.masterplan_cache.lookup, vector, self._context_partition(key)
                 )
-                
-            except (json.JSONDecodeError, ValueError) as e:
-                # If JSON parsing fails, return just the markdown
-                print(f"Error parsing API specs JSON: {str(e)}")
-                return MasterplanResponse(
-                    markdown_content=markdown_content,
-                    api_specs=[]
+                if cached is not None:
+                    return cached
+
+            response = await self._run_masterplan_cached(key)
+            result, parsed = self._parse_masterplan(response)
+            await self._settle_reply(self._masterplan_text(key), response, parsed)
+            if not parsed:
+                # Don't keep serving a reply whose API specs could not be parsed
+                self._run_masterplan_cached.cache_evict(key)
+
+            if vector is not None and parsed:
+                # Inserting may rebuild the index on eviction, keep it off the event loop
+                await asyncio.to_thread(
+                    self.masterplan_cache.add, vector, self._context_partition(key), result
                 )
+            return result
                 
         except Exception as e:
             print(f"Error generating masterplan: {str(e)}")
             return MasterplanResponse(
                 markdown_content=f"An error occurred while generating the masterplan: {str(e)}",
                 api_specs=[]
-            ) 
\ No newline at end of file
+            )
+
+    async def stream_masterplan(self, mission_statement: str, company_name: str = None,
+                                industry: str = None, business_size: str = None) -> AsyncIterator[str]:
+        """
+        Stream the raw API masterplan text as the LLM generates it
+        The output has the same shape as the LLM response: markdown followed by the API specs JSON array.
+        Once the stream completes the response is parsed and, if its API specs are valid,
+        added to the semantic cache
+        """
+        try:
+            key = self._context_key(mission_statement, company_name, industry, business_size)
+
+            # A cached masterplan is sent in one piece, re-serialized in the streamed format
+            vector = await self._embed_mission(key)
+            if vector is not None:
+                cached = await asyncio.to_thread(
+                    self.masterplan_cache.lookup, vector, self._context_partition(key)
+                )
+                if cached is not None:
+                    specs = [spec.model_dump() for spec in cached.api_specs]
+                    yield cached.markdown_content
+                    if specs:
+                        yield "\n\n" + orjson.dumps(specs, option=orjson.OPT_INDENT_2).decode()
+                    return
+
+            chunks = []
+            prompt = self._masterplan_text(key)
+            async for chunk in self.llm.astream(prompt):
+                chunks.append(chunk.content)
+                yield chunk.content
+
+        except Exception as e:
+            print(f"Error streaming masterplan: {str(e)}")
+            yield f"An error occurred while generating the masterplan: {str(e)}"
+            return
+
+        # The stream has already completed successfully, so a caching failure is only logged
+        if vector is not None:
+            try:
+                result, parsed = self._parse_masterplan("".join(chunks))
+                if not parsed:
+                    return
+                await asyncio.to_thread(
+                    self.masterplan_cache.add, vector, self._context_partition(key), result
+                )
+            except Exception as e:
+                print(f"Error caching streamed masterplan: {str(e)}")
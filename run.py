@@ -1,60 +1,26 @@
-import argparse
-import multiprocessing
-import uvicorn
-import gradio as gr
-import app
-from gradio_app import demo
+import os
+import sys
+import settings
 
 def run_fastapi():
-    """Run the FastAPI server"""
-    uvicorn.run(app.app, host="0.0.0.0", port=8000)
+    """Run the FastAPI server with gunicorn managing multiple uvicorn workers"""
+    if sys.platform == "win32":
+        # gunicorn is not available on Windows
+        import uvicorn
+        import app
+        uvicorn.run(app.app, host="0.0.0.0", port=8000, loop=settings.UVICORN_LOOP, http=settings.UVICORN_HTTP)
+        return
+    os.execvp("gunicorn", [
+        "gunicorn", "app:app",
+        "-k", "uvicorn_worker.UvicornWorker",
+        "-w", str(settings.WORKERS),
+        "--bind", "0.0.0.0:8000"
+    ])
 
-def run_gradio():
-    """Run the Gradio interface"""
-    demo.launch(server_name="0.0.0.0", server_port=7860)
-
-def run_both():
-    """Run both the FastAPI server and Gradio interface in parallel"""
-    fastapi_process = multiprocessing.Process(target=run_fastapi)
-    gradio_process = multiprocessing.Process(target=run_gradio)
-    
-    fastapi_process.start()
-    gradio_process.start()
-    
+if __name__ == "__main__":
     print("======================================")
     print("ChatOPT is running!")
     print("FastAPI server: http://localhost:8000")
-    print("Gradio UI: http://localhost:7860")
+    print("Gradio UI: http://localhost:8000/ui")
     print("======================================")
-    print("Press Ctrl+C to stop all services")
-    
-    try:
-        fastapi_process.join()
-        gradio_process.join()
-    except KeyboardInterrupt:
-        print("Shutting down...")
-        fastapi_process.terminate()
-        gradio_process.terminate()
-        fastapi_process.join()
-        gradio_process.join()
-
-if __name__ == "__main__":
-    parser = argparse.ArgumentParser(description="Run ChatOPT services")
-    parser.add_argument(
-        "--mode", 
-        type=str, 
-        choices=["fastapi", "gradio", "both"], 
-        default="both",
-        help="Which service to run (fastapi, gradio, or both)"
-    )
-    
-    args = parser.parse_args()
-    
-    if args.mode == "fastapi":
-        print("Starting FastAPI server on http://localhost:8000")
-        run_fastapi()
-    elif args.mode == "gradio":
-        print("Starting Gradio UI on http://localhost:7860")
-        run_gradio()
-    else:
-        run_both() 
\ No newline at end of file
+    run_fastapi()
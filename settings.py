@@ -0,0 +1,11 @@
+import os
+import sys
+
+# Server settings shared by app.py and run.py. Kept free of side effects so the
+# launcher can read them without building the app.
+
+# uvloop and httptools are faster than the stdlib defaults (uvloop has no Windows support)
+UVICORN_LOOP = "asyncio" if sys.platform == "win32" else "uvloop"
+UVICORN_HTTP = "httptools"
+# Number of worker processes, defaults to 2 * cores + 1
+WORKERS = int(os.getenv("WORKERS", 2 * (os.cpu_count() or 1) + 1))